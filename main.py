@@ -6,6 +6,7 @@
 
 import os, re, time, math, hmac, base64, hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from io import BytesIO
 from urllib.parse import urlparse, urljoin, quote_plus
 
@@ -59,14 +60,20 @@ _SESSION.headers.update({
 
 
 # ================== DingTalk 加签与发送 ==================
+@lru_cache(maxsize=8)
+def _hmac_proto(secret: str):
+    # 同一 secret 只做一次密钥初始化，之后每次签名 copy() 原型
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
 def _build_signed_webhook(base_url: str, secret: str) -> str:
     base_url = (base_url or "").strip()
     if not base_url or not secret:
         return base_url
     ts = str(int(time.time() * 1000))
     string_to_sign = f"{ts}\n{secret}"
-    h = hmac.new(secret.encode("utf-8"), string_to_sign.encode("utf-8"), hashlib.sha256).digest()
-    sign = quote_plus(base64.b64encode(h))
+    mac = _hmac_proto(secret).copy()
+    mac.update(string_to_sign.encode("utf-8"))
+    sign = quote_plus(base64.b64encode(mac.digest()))
     sep = "&" if ("?" in base_url) else "?"
     return f"{base_url}{sep}timestamp={ts}&sign={sign}"
 
@@ -97,38 +104,55 @@ def get_date_range():
 
 
 # ================== 分类 ==================
+# 按优先级排列；每类关键词合成一个正则，一次扫描代替逐词 in
+_CLASSIFY_RULES = tuple((re.compile("|".join(kws)), label) for kws, label in (
+    (("中标", "成交", "结果", "定标", "候选人公示", "成交公告", "中标公告"), "中标公告"),
+    (("更正", "变更", "澄清", "补遗"), "更正公告"),
+    (("终止", "废标", "流标"), "终止公告"),
+    (("招标", "采购", "磋商", "邀请", "比选", "谈判", "竞争性", "公开招标"), "招标公告"),
+))
+
 def classify(title: str) -> str:
     t = title or ""
-    if any(k in t for k in ["中标", "成交", "结果", "定标", "候选人公示", "成交公告", "中标公告"]): return "中标公告"
-    if any(k in t for k in ["更正", "变更", "澄清", "补遗"]): return "更正公告"
-    if any(k in t for k in ["终止", "废标", "流标"]): return "终止公告"
-    if any(k in t for k in ["招标", "采购", "磋商", "邀请", "比选", "谈判", "竞争性", "公开招标"]): return "招标公告"
+    for pat, label in _CLASSIFY_RULES:
+        if pat.search(t): return label
     return "其他"
 
 
 # ================== 文本工具 ==================
+# 逐字符替换表：一次 str.translate 代替多次 replace 链
+_SPACE_TABLE = str.maketrans({"\u3000": " ", "\xa0": " "})
+_DATE_SEP_TABLE = str.maketrans({".": "-", "/": "-"})
+_AMOUNT_TABLE = str.maketrans({"，": None, ",": None})
+_DATE_NORM_TABLE = str.maketrans({"年": "-", "月": "-", "日": " ", "/": "-", "：": ":", "．": "."})
+_DASH_TABLE = str.maketrans({"－": "-", "—": "-"})
+
 def _safe_text(s: str) -> str:
-    return (s or "").replace("\u3000", " ").replace("\xa0", " ").strip()
+    return (s or "").translate(_SPACE_TABLE).strip()
+
+# 日期相关正则：模块级编译一次，逐条公告/逐个字段调用时直接复用
+_WS_RE = re.compile(r"\s+")
+_DATE_IN_TEXT_RE = re.compile(r"(20\d{2}[-/.]\d{1,2}[-/.]\d{1,2})")
+_DATE_TIME_RE = re.compile(r"(20\d{2})[-\.](\d{1,2})[-\.](\d{1,2})(?:\s+(\d{1,2}):(\d{2}))?")
 
 def _date_in_text(s: str):
-    if not s: return ""
-    m = re.search(r"(20\d{2}[-/.]\d{1,2}[-/.]\d{1,2})", s)
-    return m.group(1).replace(".", "-").replace("/", "-") if m else ""
+    # 两个日期正则都以字面量 "20" 开头：不含 "20" 的文本直接跳过正则与替换
+    if not s or "20" not in s: return ""
+    m = _DATE_IN_TEXT_RE.search(s)
+    return m.group(1).translate(_DATE_SEP_TABLE) if m else ""
 
 def _normalize_amount_text(s: str) -> str:
     if not s: return ""
-    s = str(s).replace("，", ",").replace(",", "")
-    s = re.sub(r"\s+", "", s)
-    return s
+    s = str(s).translate(_AMOUNT_TABLE)
+    return "".join(s.split())
 
 def _normalize_date_string(s: str) -> str:
-    if not s: return ""
+    if not s or "20" not in s: return ""
     s = s.strip()
-    s = s.replace("年", "-").replace("月", "-").replace("日", " ")
-    s = s.replace("/", "-").replace("：", ":").replace("．", ".")
-    s = re.sub(r"\s+", " ", s)
+    s = s.translate(_DATE_NORM_TABLE)
+    s = " ".join(s.split())
 
-    m = re.search(r"(20\d{2})[-\.](\d{1,2})[-\.](\d{1,2})(?:\s+(\d{1,2}):(\d{2}))?", s)
+    m = _DATE_TIME_RE.search(s)
     if not m:
         return ""
     y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
@@ -143,16 +167,19 @@ def _normalize_date_string(s: str) -> str:
 
 def _to_datetime(s: str):
     if not s: return None
-    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
-        try:
-            return datetime.strptime(s, fmt)
-        except Exception:
-            pass
-    return None
+    # 两种格式只差时分：按有无冒号选定格式，只解析一次，不靠异常试错
+    fmt = "%Y-%m-%d %H:%M" if ":" in s else "%Y-%m-%d"
+    try:
+        return datetime.strptime(s, fmt)
+    except Exception:
+        return None
+
+# _pick_first 的候选正则统一在模块级编译，标志位（re.S | re.I）直接编进 pattern
+_PICK_FLAGS = re.S | re.I
 
 def _pick_first(text: str, patterns):
     for pat in patterns:
-        m = re.search(pat, text, re.S | re.I)
+        m = pat.search(text)
         if m:
             val = m.group(1).strip()
             if val:
@@ -160,51 +187,64 @@ def _pick_first(text: str, patterns):
     return ""
 
 
+_DEADLINE_PATS = tuple(re.compile(p, _PICK_FLAGS) for p in (
+    r"(?:投标(?:文件)?|递交(?:响应)?文件|响应文件提交|报价|报名|获取招标文件)\s*截止(?:时间|日期)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
+    r"(?:截止(?:时间|日期))\s*[:：]?\s*([^\n\r，。;；]{6,40})(?=.*?(?:投标|递交|响应|报价|报名))",
+    r"(?:提交|递交)\s*截止(?:时间|日期)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
+    r"(?:截止至)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
+))
+_BID_OPEN_PATS = (
+    re.compile(r"(?:开标(?:时间|日期))\s*[:：]?\s*([^\n\r，。;；]{6,40})", _PICK_FLAGS),
+)
+
 def extract_deadline(detail_text: str) -> str:
     txt = _safe_text(detail_text)
 
-    pats = [
-        r"(?:投标(?:文件)?|递交(?:响应)?文件|响应文件提交|报价|报名|获取招标文件)\s*截止(?:时间|日期)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
-        r"(?:截止(?:时间|日期))\s*[:：]?\s*([^\n\r，。;；]{6,40})(?=.*?(?:投标|递交|响应|报价|报名))",
-        r"(?:提交|递交)\s*截止(?:时间|日期)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
-        r"(?:截止至)\s*[:：]?\s*([^\n\r，。;；]{6,40})",
-    ]
-    s = _pick_first(txt, pats)
+    s = _pick_first(txt, _DEADLINE_PATS)
     norm = _normalize_date_string(s)
     if norm:
         return norm
 
-    s2 = _pick_first(txt, [r"(?:开标(?:时间|日期))\s*[:：]?\s*([^\n\r，。;；]{6,40})"])
+    s2 = _pick_first(txt, _BID_OPEN_PATS)
     norm2 = _normalize_date_string(s2)
     return norm2 or ""
 
 
+# 章节序号用字符类匹配（"一、"/"二、" 已包含在字符类中，无需再写分支）
+_BRIEF_OVERVIEW_RE = re.compile(r"项目概况\s*([\s\S]{0,900}?)(?=\n\s*[一二三四五六七八九十]、|$)")
+_BRIEF_BASIC_RE = re.compile(r"项目基本情况\s*([\s\S]{0,900}?)(?=\n\s*[二三四五六七八九十]、|$)")
+_BRIEF_SCOPE_RE = re.compile(r"(?:采购需求|服务范围|项目内容|服务内容)\s*[:：]?\s*([\s\S]{0,300}?)\n")
+_BRIEF_LEAD_PUNCT_RE = re.compile(r"^[：:、\-，。.\s]*")
+
 def extract_project_brief(detail_text: str, max_len: int = 120) -> str:
     txt = _safe_text(detail_text)
     blocks = []
 
-    m = re.search(r"项目概况\s*([\s\S]{0,900}?)(?=\n\s*[一二三四五六七八九十]、|\n\s*一、|$)", txt)
+    m = _BRIEF_OVERVIEW_RE.search(txt)
     if m:
         blocks.append(m.group(1))
 
-    m2 = re.search(r"(?:项目基本情况|一、项目基本情况)\s*([\s\S]{0,900}?)(?=\n\s*[二三四五六七八九十]、|\n\s*二、|$)", txt)
+    m2 = _BRIEF_BASIC_RE.search(txt)
     if m2:
         blocks.append(m2.group(1))
 
-    m3 = re.search(r"(?:采购需求|服务范围|项目内容|服务内容)\s*[:：]?\s*([\s\S]{0,300}?)\n", txt)
+    m3 = _BRIEF_SCOPE_RE.search(txt)
     if m3:
         blocks.append(m3.group(1))
 
     block = ""
     for b in blocks:
-        b = re.sub(r"\s+", " ", (b or "")).strip()
-        b = re.sub(r"^[：:、\-，。.\s]*", "", b).strip()
+        b = " ".join((b or "").split())
+        b = _BRIEF_LEAD_PUNCT_RE.sub("", b).strip()
         if len(b) >= 20:
             block = b
             break
 
     if not block:
-        plain = re.sub(r"\s+", " ", txt)
+        # 只需前 max_len 个字符：先截取有限前缀再压空白，空白过多时才回退到全文
+        plain = _WS_RE.sub(" ", txt[:max_len * 4])
+        if len(plain) < max_len and len(txt) > max_len * 4:
+            plain = _WS_RE.sub(" ", txt)
         block = plain[:max_len]
 
     block = block[:max_len] + ("..." if len(block) > max_len else "")
@@ -212,16 +252,28 @@ def extract_project_brief(detail_text: str, max_len: int = 120) -> str:
 
 
 # ================== PDF 文本读取 ==================
+_PDF_MAX_BYTES = 20 * 1024 * 1024  # 超过此大小的附件不下载
+
 def fetch_pdf_text(url: str, referer: str = None, timeout=20) -> str:
     try:
         headers = {"User-Agent":"Mozilla/5.0"}
         if referer:
             headers["Referer"] = referer
-        r = _SESSION.get(url, headers=headers, timeout=timeout)
-        ct = (r.headers.get("Content-Type") or "").lower()
-        if "pdf" not in ct and not url.lower().endswith(".pdf"):
-            return ""
-        with pdfplumber.open(BytesIO(r.content)) as pdf:
+        # 流式请求：先看响应头，不是 PDF 或过大就直接断开，不下载正文
+        with _SESSION.get(url, headers=headers, timeout=timeout, stream=True) as r:
+            ct = (r.headers.get("Content-Type") or "").lower()
+            if "pdf" not in ct and not url.lower().endswith(".pdf"):
+                return ""
+            size = r.headers.get("Content-Length")
+            if size and size.isdigit() and int(size) > _PDF_MAX_BYTES:
+                return ""
+            buf = BytesIO()
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                buf.write(chunk)
+                if buf.tell() > _PDF_MAX_BYTES:
+                    return ""
+        buf.seek(0)
+        with pdfplumber.open(buf) as pdf:
             pages = []
             for p in pdf.pages:
                 try:
@@ -235,6 +287,8 @@ def fetch_pdf_text(url: str, referer: str = None, timeout=20) -> str:
 
 
 # ================== 详情文本抽取（增强：更多容器 + 附件 PDF 兜底） ==================
+_HREF_RE = re.compile(r'href=["\'](.*?)["\']', re.I)
+
 def extract_detail_text_with_pdf_fallback(driver, page_html: str, page_url: str):
     xps = [
         "//*[@id='vsb_content']",
@@ -257,7 +311,7 @@ def extract_detail_text_with_pdf_fallback(driver, page_html: str, page_url: str)
             pass
 
     try:
-        links = re.findall(r'href=["\'](.*?)["\']', page_html, flags=re.I)
+        links = _HREF_RE.findall(page_html)
         pdfs = []
         for h in links:
             absu = urljoin(page_url, (h or "").strip())
@@ -290,60 +344,60 @@ def extract_detail_text_with_pdf_fallback(driver, page_html: str, page_url: str)
 
 
 # ================== 招标字段解析（增强：预算/采购人/代理/地址/联系人/电话/截止/摘要） ==================
+_AMOUNT_PATS = tuple(re.compile(p, _PICK_FLAGS) for p in (
+    r"(?:预算金额|采购预算)\s*[:：]?\s*([0-9\.,，]+\s*(?:万元|元))",
+    r"(?:最高限价|控制价)\s*[:：]?\s*([0-9\.,，]+\s*(?:万元|元))",
+))
+_PURCHASER_PATS = (re.compile(r"(?:采购人|采购单位|招标人)\s*[:：]?\s*([^\n\r，。;；]{2,60})", _PICK_FLAGS),)
+_AGENT_PATS = (re.compile(r"(?:采购代理机构|代理机构|招标代理)\s*[:：]?\s*([^\n\r，。;；]{2,60})", _PICK_FLAGS),)
+_ADDRESS_PATS = (re.compile(r"(?:地址|项目地点|服务地点|实施地点)\s*[:：]?\s*([^\n\r。；;]{5,80})", _PICK_FLAGS),)
+_CONTACT_PATS = (re.compile(r"(?:联系人|项目联系人|采购人联系人)\s*[:：]?\s*([^\s、，。;；]{2,20})", _PICK_FLAGS),)
+_PHONE_PATS = (re.compile(r"(?:联系电话|联系方式|电\s*话)\s*[:：]?\s*([0-9\-－—\s]{6,})", _PICK_FLAGS),)
+_CONTACT_PHONE_RE = re.compile(
+    r"项目联系人[：:\s]*([^\s、，。;；]+)[\s\S]{0,120}?"
+    r"(?:电\s*话|联系电话|联系方式)[：:\s]*([0-9\-－—\s]{6,})",
+    re.S
+)
+_GET_DOC_RE = re.compile(r"(潜在投标人.*?获取招标文件.*?)(?=。\s|\n)")
+_TERM_RE = re.compile(r"(?:服务期限|合同履行期限|履约期限)\s*[:：]?\s*([^\n\r。；;]{3,60})")
+
 def parse_bidding_fields(detail_text: str):
     txt = _safe_text(detail_text)
 
-    amount = _pick_first(txt, [
-        r"(?:预算金额|采购预算)\s*[:：]?\s*([0-9\.,，]+\s*(?:万元|元))",
-        r"(?:最高限价|控制价)\s*[:：]?\s*([0-9\.,，]+\s*(?:万元|元))",
-    ])
+    amount = _pick_first(txt, _AMOUNT_PATS)
     amount = _normalize_amount_text(amount) if amount else "暂无"
 
-    purchaser = _pick_first(txt, [
-        r"(?:采购人|采购单位|招标人)\s*[:：]?\s*([^\n\r，。;；]{2,60})",
-    ])
+    purchaser = _pick_first(txt, _PURCHASER_PATS)
     purchaser = purchaser or "暂无"
 
-    agent = _pick_first(txt, [
-        r"(?:采购代理机构|代理机构|招标代理)\s*[:：]?\s*([^\n\r，。;；]{2,60})",
-    ])
+    agent = _pick_first(txt, _AGENT_PATS)
     agent = agent or "暂无"
 
-    address = _pick_first(txt, [
-        r"(?:地址|项目地点|服务地点|实施地点)\s*[:：]?\s*([^\n\r。；;]{5,80})",
-    ])
+    address = _pick_first(txt, _ADDRESS_PATS)
     address = address or "暂无"
 
     contact = "暂无"
     phone   = "暂无"
-    m_cp = re.search(
-        r"项目联系人[：:\s]*([^\s、，。;；]+)[\s\S]{0,120}?"
-        r"(?:电\s*话|联系电话|联系方式)[：:\s]*([0-9\-－—\s]{6,})",
-        txt, re.S
-    )
+    m_cp = _CONTACT_PHONE_RE.search(txt)
     if m_cp:
         contact = m_cp.group(1).strip()
-        phone = re.sub(r"\s+", "", m_cp.group(2)).replace("－", "-").replace("—", "-")
+        phone = "".join(m_cp.group(2).split()).translate(_DASH_TABLE)
     else:
-        c2 = _pick_first(txt, [
-            r"(?:联系人|项目联系人|采购人联系人)\s*[:：]?\s*([^\s、，。;；]{2,20})"
-        ])
-        p2 = _pick_first(txt, [
-            r"(?:联系电话|联系方式|电\s*话)\s*[:：]?\s*([0-9\-－—\s]{6,})"
-        ])
+        c2 = _pick_first(txt, _CONTACT_PATS)
+        p2 = _pick_first(txt, _PHONE_PATS)
         if c2: contact = c2
-        if p2: phone = re.sub(r"\s+", "", p2).replace("－", "-").replace("—", "-")
+        if p2: phone = "".join(p2.split()).translate(_DASH_TABLE)
 
     deadline = extract_deadline(txt) or "暂无"
 
     brief = extract_project_brief(txt, max_len=BRIEF_MAX_LEN) or "暂无"
 
     extra = []
-    m_get = re.search(r"(潜在投标人.*?获取招标文件.*?)(?=。\s|\n)", txt)
+    m_get = _GET_DOC_RE.search(txt)
     if m_get:
-        extra.append(re.sub(r"\s+", " ", m_get.group(1)).strip())
+        extra.append(" ".join(m_get.group(1).split()))
 
-    m_term = re.search(r"(?:服务期限|合同履行期限|履约期限)\s*[:：]?\s*([^\n\r。；;]{3,60})", txt)
+    m_term = _TERM_RE.search(txt)
     if m_term:
         extra.append(f"期限：{m_term.group(1).strip()}")
 
@@ -39,16 +39,19 @@
 
 import os
 import re
+import json
 import time
 import ssl
 import hmac
 import base64
-import hashlib
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta, date
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urldefrag
 
 import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
@@ -63,11 +66,43 @@ except Exception:
 # ===================== 通用 =====================
 TZ = ZoneInfo(os.getenv("HR_TZ", "Asia/Shanghai"))
 
+# 进程内共享会话：同一主机的多次请求复用 keep-alive 连接
+_SESSION = requests.Session()
+# 新浪 GET 的偶发 429/5xx / 读超时退避重试，不必整次任务重跑。
+# 钉钉 POST 不在 allowed_methods 中：只重试建连失败（请求未发出），
+# 读超时 / 5xx 时消息可能已送达，重发会在群里重复推送；限流走 200 + errcode。
+_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+)))
+
+YMD_SEP_RE = re.compile(r"[-/\.]")
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+
 def now_cn() -> datetime:
     return datetime.now(TZ)
 
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # str.split() 的空白判定与 \s 一致，且自带首尾去空
+    return " ".join((s or "").split())
+
+def sniff_charset(content: bytes, default: str = "utf-8") -> str:
+    """
+    只看页面开头的 <meta charset>，代替 apparent_encoding 对全文的统计探测
+    """
+    m = META_CHARSET_RE.search(content[:4096])
+    return m.group(1).decode("ascii") if m else default
+
+def response_charset(r) -> str:
+    """
+    响应头显式声明的 charset 优先，否则看 <meta charset>，都没有按 UTF-8。
+    传给 BeautifulSoup(from_encoding=...)，免得 UnicodeDammit 退回到全文的编码探测
+    """
+    ct = (r.headers.get("Content-Type") or "").lower()
+    if "charset=" in ct:
+        return ct.split("charset=", 1)[1].split(";", 1)[0].strip(" \"'") or "utf-8"
+    return sniff_charset(r.content)
 
 def truncate_text(s: str, max_len: int = 70) -> str:
     s = norm(s)
@@ -84,7 +119,7 @@ def parse_ymd(s: str):
     if not s:
         return None
     try:
-        y, m, d = map(int, re.split(r"[-/\.]", s))
+        y, m, d = map(int, YMD_SEP_RE.split(s))
         return date(y, m, d)
     except Exception:
         return None
@@ -131,7 +166,7 @@ def dingtalk_signed_url(webhook_or_token: str, secret: str) -> str:
     to_sign = f"{ts}\n{secret}"
     sign = urllib.parse.quote_plus(
         base64.b64encode(
-            hmac.new(secret.encode("utf-8"), to_sign.encode("utf-8"), hashlib.sha256).digest()
+            hmac.digest(secret.encode("utf-8"), to_sign.encode("utf-8"), "sha256")
         )
     )
     return f"https://oapi.dingtalk.com/robot/send?access_token={token}&timestamp={ts}&sign={sign}"
@@ -139,7 +174,9 @@ def dingtalk_signed_url(webhook_or_token: str, secret: str) -> str:
 def dingtalk_send_markdown_to(webhook: str, secret: str, title: str, markdown_text: str) -> dict:
     url = dingtalk_signed_url(webhook, secret)
     payload = {"msgtype": "markdown", "markdown": {"title": title, "text": markdown_text}}
-    r = requests.post(url, json=payload, timeout=25)
+    # 直接发 UTF-8：中文不转义成 \uXXXX，请求体约小一半
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    r = _SESSION.post(url, data=body, headers={"Content-Type": "application/json; charset=utf-8"}, timeout=25)
     r.raise_for_status()
     data = r.json()
     if str(data.get("errcode")) != "0":
@@ -185,28 +222,28 @@ SINA_MAX_PAGES = int(os.getenv("SINA_MAX_PAGES", "5"))
 SINA_SLEEP_SEC = float(os.getenv("SINA_SLEEP_SEC", "0.8"))
 SINA_MAX_ITEMS = int(os.getenv("SINA_MAX_ITEMS", "15"))
 SINA_DATE_RE = re.compile(r"\((\d{2})月(\d{2})日\s*(\d{2}):(\d{2})\)")
+SINA_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "zh-CN,zh;q=0.9",
+}
 
 def sina_get_html(url: str) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (X11; Linux x86_64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "zh-CN,zh;q=0.9",
-    }
-    r = requests.get(url, headers=headers, timeout=15)
+    r = _SESSION.get(url, headers=SINA_HEADERS, timeout=15)
     r.raise_for_status()
     if not r.encoding or r.encoding.lower() == "iso-8859-1":
-        r.encoding = r.apparent_encoding
+        r.encoding = sniff_charset(r.content)
     return r.text
 
-def sina_parse_datetime(text: str):
+def sina_parse_datetime(text: str, now: datetime = None):
     m = SINA_DATE_RE.search(text or "")
     if not m:
         return None
     month, day, hh, mm = map(int, m.groups())
-    now = now_cn()
+    now = now or now_cn()
     year = now.year
     if now.month == 1 and month == 12:
         year -= 1
@@ -221,33 +258,39 @@ def sina_find_next_page(soup: BeautifulSoup):
         return urljoin(SINA_START_URL, a["href"])
     return None
 
+def sina_abs_url(href: str) -> str:
+    # 滚动页链接绝大多数已是绝对地址 / 协议相对地址，直接返回，免去 urljoin 的解析
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("//"):
+        return "https:" + href
+    return urljoin(SINA_START_URL, href)
+
+# 链接特征加权：正文页 > 文章页 > 财经频道
+SINA_LINK_WEIGHTS = ((".shtml", 10), ("/doc-", 8), ("/article/", 6), ("finance.sina.com.cn", 2))
+
+def sina_link_score(u: str) -> int:
+    return sum(w for k, w in SINA_LINK_WEIGHTS if k in u)
+
 def sina_pick_best_link(li: Tag):
     links = []
     for a in li.find_all("a", href=True):
         href = (a.get("href") or "").strip()
         if not href:
             continue
-        abs_url = urljoin(SINA_START_URL, href)
+        abs_url = sina_abs_url(href)
         text = a.get_text(strip=True)
         links.append((abs_url, text))
     if not links:
         return None, None
 
-    def score(u: str):
-        s = 0
-        if ".shtml" in u: s += 10
-        if "/doc-" in u: s += 8
-        if "/article/" in u: s += 6
-        if "finance.sina.com.cn" in u: s += 2
-        return s
-
-    links.sort(key=lambda x: score(x[0]), reverse=True)
-    return links[0][0], links[0][1]
+    # 只要得分最高的一条：max 一次扫描即可（同分取最先出现，与稳定排序后取首条一致）
+    return max(links, key=lambda x: sina_link_score(x[0]))
 
-def crawl_sina_target_day():
+def crawl_sina_target_day(now: datetime = None):
     override = parse_ymd(os.getenv("SINA_TARGET_DATE"))
-    today = now_cn().date()
-    target = override or target_prev_workday(today)
+    now = now or now_cn()
+    target = override or target_prev_workday(now.date())
 
     seen_link = set()
     seen_tt = set()
@@ -258,7 +301,7 @@ def crawl_sina_target_day():
 
     for _ in range(1, SINA_MAX_PAGES + 1):
         html = sina_get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         container = soup.select_one("div.listBlk")
         if not container:
@@ -267,9 +310,10 @@ def crawl_sina_target_day():
         if not lis:
             break
 
-        for li in lis:
-            text_all = li.get_text(" ", strip=True)
-            dt = sina_parse_datetime(text_all)
+        # 每条只解析一次时间，翻页判断复用同一结果
+        dated = [(li, sina_parse_datetime(li.get_text(" ", strip=True), now)) for li in lis]
+
+        for li, dt in dated:
             if not dt or dt.date() != target:
                 continue
 
@@ -294,8 +338,7 @@ def crawl_sina_target_day():
             hit = True
 
         if hit:
-            dts = [sina_parse_datetime(li.get_text(" ", strip=True)) for li in lis]
-            dts = [d for d in dts if d]
+            dts = [d for _, d in dated if d]
             if dts and all(d.date() < target for d in dts):
                 break
 
@@ -325,13 +368,44 @@ def make_session():
         "Accept-Language": "zh-CN,zh;q=0.9"
     })
     r = Retry(total=3, backoff_factor=0.6, status_forcelist=[500, 502, 503, 504])
-    s.mount("https://", LegacyTLSAdapter(max_retries=r))
+    s.mount("https://", LegacyTLSAdapter(max_retries=r, pool_connections=4, pool_maxsize=8))
     return s
 
 CN_TITLE_DATE = re.compile(r"[（(]\s*(20\d{2})\s*[年\-/.]\s*(\d{1,2})\s*[月\-/.]\s*(\d{1,2})\s*[)）]")
 SECTION_BLACKLIST = {"AI最前沿", "热点速递", "行业观察", "最新动态"}
 CIRCLED = "①②③④⑤⑥⑦⑧⑨⑩"
-
+NUMBERED_LINE_RE = re.compile(r"^\s*[（(]?\s*\d{1,2}\s*[)）]?\s*[、.．]\s*\S+")
+# 节点首个文本片段的粗筛：以数字（或单独的左括号）开头才可能是编号标题
+NUMBERED_LEAD_RE = re.compile(r"^\s*[（(]?\s*(?:\d|$)")
+# 依次剥离：阿拉伯序号、圈号、全角序号（一次扫描完成）
+LEADING_NUM_RE = re.compile(
+    r"^\s*(?:[（(]?\s*\d{1,2}\s*[)）]?\s*[、.．]\s*)?"
+    r"(?:[" + CIRCLED + r"]\s*)?"
+    r"(?:[０-９]+\s*[、.．]\s*)?"
+)
+TITLE_PAREN_RE = re.compile(r"[（(]")
+HRLOO_DAILY_TITLE_RE = re.compile(r"三茅日[报報]")
+HRLOO_NEWS_HREF_RE = re.compile(r"/news/\d+\.html$")
+
+# CSS 选择器同样在模块加载时编译一次（soupsieve 为 bs4 自带依赖）
+HRLOO_LIST_ITEM_SEL = sv.compile("div.dwxfd-list-items div.dwxfd-list-content-left")
+HRLOO_NEWS_LINK_SEL = sv.compile("a[href*='/news/']")
+HRLOO_H2_TITLE_SEL = sv.compile("h2.style-h2, h2[class*='style-h2']")
+HRLOO_NOISE_SEL = sv.compile(".other-wrap, .txt, .footer, .bottom")
+HRLOO_CONTAINER_CSS = (
+    ".content-con.fn-wenda-detail-infomation",
+    ".fn-wenda-detail-infomation",
+    ".content-con.hr-rich-text.fn-wenda-detail-infomation",
+    ".hr-rich-text.fn-wenda-detail-infomation",
+    ".fn-hr-rich-text.custom-style-warp",
+    ".custom-style-warp",
+    ".content-wrap-con",
+)
+# 并集选择器只遍历一次文档树；优先级再用单个选择器的 match 判定
+HRLOO_CONTAINER_ANY = sv.compile(", ".join(HRLOO_CONTAINER_CSS))
+HRLOO_CONTAINER_SELS = [sv.compile(sel) for sel in HRLOO_CONTAINER_CSS]
+
+@lru_cache(maxsize=256)
 def date_from_bracket_title(text: str):
     m = CN_TITLE_DATE.search(text or "")
     if not m:
@@ -343,45 +417,55 @@ def date_from_bracket_title(text: str):
         return None
 
 def looks_like_numbered(text: str) -> bool:
-    return bool(re.match(r"^\s*[（(]?\s*\d{1,2}\s*[)）]?\s*[、.．]\s*\S+", text or ""))
+    return bool(NUMBERED_LINE_RE.match(text or ""))
 
 def strip_leading_num(t: str) -> str:
-    t = re.sub(r"^\s*[（(]?\s*\d{1,2}\s*[)）]?\s*[、.．]\s*", "", t)
-    t = re.sub(r"^\s*[" + CIRCLED + r"]\s*", "", t)
-    t = re.sub(r"^\s*[０-９]+\s*[、.．]\s*", "", t)
-    return t.strip()
+    return LEADING_NUM_RE.sub("", t, count=1).strip()
 
 class HRLooCrawler:
-    def __init__(self):
+    def __init__(self, now: datetime = None):
         self.session = make_session()
         self.results = []
+        # 已抓过的详情页（去掉 #fragment），跨入口页/跨区块不重复抓取
+        self._tried = set()
 
         override = parse_ymd(os.getenv("HR_TARGET_DATE"))
-        self.target_date = override or now_cn().date()
+        self.target_date = override or (now or now_cn()).date()
 
-        self.daily_title_pat = re.compile(r"三茅日[报報]")
+        self.daily_title_pat = HRLOO_DAILY_TITLE_RE
         self.sources = [u.strip() for u in os.getenv(
             "SRC_HRLOO_URLS",
             "https://www.hrloo.com/,https://www.hrloo.com/news/hr"
         ).split(",") if u.strip()]
 
     def crawl(self):
-        for base in self.sources:
-            if self._crawl_source(base):
-                break
+        # 各入口页互不依赖：并发拉取，仍按配置顺序解析，命中即停。
+        # 不用 with：命中后不等候补入口页的请求（可能超时 + 重试）结束就返回
+        ex = ThreadPoolExecutor(max_workers=max(1, len(self.sources)))
+        try:
+            futures = [ex.submit(self._fetch_index, base) for base in self.sources]
+            for base, fut in zip(self.sources, futures):
+                r = fut.result()
+                if r is not None and self._crawl_source(base, r):
+                    break
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
 
-    def _crawl_source(self, base):
+    def _fetch_index(self, base):
         try:
             r = self.session.get(base, timeout=20)
         except Exception:
-            return False
+            return None
         if r.status_code != 200:
-            return False
+            return None
+        return r
 
-        soup = BeautifulSoup(r.text, "html.parser")
+    def _crawl_source(self, base, r):
+        soup = BeautifulSoup(r.content, "lxml", from_encoding=response_charset(r))
 
-        items = soup.select("div.dwxfd-list-items div.dwxfd-list-content-left")
+        items = HRLOO_LIST_ITEM_SEL.select(soup)
         if items:
+            cands = []
             for div in items:
                 a = div.find("a", href=True)
                 if not a:
@@ -392,14 +476,14 @@ class HRLooCrawler:
                 t2 = date_from_bracket_title(title_text)
                 if t2 and t2 != self.target_date:
                     continue
-                abs_url = urljoin(base, a["href"])
-                if self._try_detail(abs_url):
-                    return True
+                cands.append(urljoin(base, a["href"]))
+            if self._try_details(cands):
+                return True
 
         links = []
-        for a in soup.select("a[href*='/news/']"):
+        for a in HRLOO_NEWS_LINK_SEL.select(soup):
             href = a.get("href", "")
-            if not re.search(r"/news/\d+\.html$", href):
+            if not HRLOO_NEWS_HREF_RE.search(href):
                 continue
             text = norm(a.get_text())
             if not self.daily_title_pat.search(text):
@@ -409,17 +493,25 @@ class HRLooCrawler:
                 continue
             links.append(urljoin(base, href))
 
-        seen = set()
-        for u in links:
-            if u in seen:
-                continue
-            seen.add(u)
-            if self._try_detail(u):
-                return True
+        return self._try_details(links)
+
+    def _try_details(self, urls):
+        # 候选详情页并发抓取，按原顺序校验，第一个合格的即采用
+        urls = [u for u in dict.fromkeys(urldefrag(u)[0] for u in urls) if u not in self._tried]
+        if not urls:
+            return False
+        self._tried.update(urls)
+        with ThreadPoolExecutor(max_workers=min(4, len(urls))) as ex:
+            futures = [ex.submit(self._fetch_detail_clean, u) for u in urls]
+            for u, fut in zip(urls, futures):
+                if self._try_detail(u, fut.result()):
+                    for f in futures:
+                        f.cancel()
+                    return True
         return False
 
-    def _try_detail(self, abs_url):
-        _, titles, page_title = self._fetch_detail_clean(abs_url)
+    def _try_detail(self, abs_url, detail):
+        _, titles, page_title = detail
         if not page_title or not self.daily_title_pat.search(page_title):
             return False
 
@@ -438,12 +530,12 @@ class HRLooCrawler:
 
     def _extract_h2_titles(self, root: Tag):
         out = []
-        for h2 in root.select("h2.style-h2, h2[class*='style-h2']"):
+        for h2 in HRLOO_H2_TITLE_SEL.select(root):
             text = norm(h2.get_text())
             if not text:
                 continue
             text = strip_leading_num(text)
-            text = re.split(r"[（(]", text)[0].strip()
+            text = TITLE_PAREN_RE.split(text, 1)[0].strip()
             if not text:
                 continue
             if text in SECTION_BLACKLIST:
@@ -451,52 +543,41 @@ class HRLooCrawler:
             if len(text) >= 4:
                 out.append(text)
 
-        seen, final = set(), []
-        for t in out:
-            if t not in seen:
-                seen.add(t)
-                final.append(t)
-        return final
+        return list(dict.fromkeys(out))
 
     def _extract_numbered_titles(self, root: Tag):
         out = []
         for p in root.find_all(["p", "h2", "h3", "div", "span", "li"]):
+            lead = next((t for t in p.strings if not t.isspace()), "")
+            if not NUMBERED_LEAD_RE.match(lead):
+                continue
             text = norm(p.get_text())
             if looks_like_numbered(text):
                 text = strip_leading_num(text)
-                text = re.split(r"[（(]", text)[0].strip()
+                text = TITLE_PAREN_RE.split(text, 1)[0].strip()
                 if text and len(text) >= 4 and text not in SECTION_BLACKLIST:
                     out.append(text)
-        seen, final = set(), []
-        for t in out:
-            if t not in seen:
-                seen.add(t)
-                final.append(t)
-        return final
+        return list(dict.fromkeys(out))
 
     def _pick_container(self, soup: BeautifulSoup):
-        selectors = [
-            ".content-con.fn-wenda-detail-infomation",
-            ".fn-wenda-detail-infomation",
-            ".content-con.hr-rich-text.fn-wenda-detail-infomation",
-            ".hr-rich-text.fn-wenda-detail-infomation",
-            ".fn-hr-rich-text.custom-style-warp",
-            ".custom-style-warp",
-            ".content-wrap-con",
-        ]
-        for sel in selectors:
-            node = soup.select_one(sel)
-            if node:
-                return node
-        return soup
+        # 与逐个 select_one 等价：取优先级最高的选择器在文档顺序中的第一个命中
+        best, best_rank = soup, len(HRLOO_CONTAINER_SELS)
+        for node in HRLOO_CONTAINER_ANY.select(soup):
+            for rank in range(best_rank):
+                if HRLOO_CONTAINER_SELS[rank].match(node):
+                    best, best_rank = node, rank
+                    break
+            if best_rank == 0:
+                break
+        return best
 
     def _fetch_detail_clean(self, url):
         try:
             r = self.session.get(url, timeout=(6, 20))
             if r.status_code != 200:
                 return None, [], ""
-            r.encoding = r.apparent_encoding or "utf-8"
-            soup = BeautifulSoup(r.text, "html.parser")
+            # 编码由响应头 / <meta charset> 明确给出，bs4 不再做全文编码探测
+            soup = BeautifulSoup(r.content, "lxml", from_encoding=response_charset(r))
 
             h1 = soup.find("h1")
             page_title = norm(h1.get_text()) if h1 else ""
@@ -505,8 +586,9 @@ class HRLooCrawler:
                 page_title = norm(title_tag.get_text()) if title_tag else ""
 
             container = self._pick_container(soup)
-            for sel in [".other-wrap", ".txt", ".footer", ".bottom"]:
-                for bad in container.select(sel):
+            # 一次遍历选出全部噪声块；嵌套在已删除块里的节点会随父节点一起销毁
+            for bad in HRLOO_NOISE_SEL.select(container):
+                if not bad.decomposed:
                     bad.decompose()
 
             titles = self._extract_h2_titles(container)
@@ -517,8 +599,8 @@ class HRLooCrawler:
         except Exception:
             return None, [], ""
 
-def crawl_hrloo():
-    c = HRLooCrawler()
+def crawl_hrloo(now: datetime = None):
+    c = HRLooCrawler(now)
     c.crawl()
     if not c.results:
         return None, []
@@ -532,7 +614,8 @@ RE_DATE_DASH = re.compile(r"\b(20\d{2}-\d{2}-\d{2})\b")
 RE_DATE_CN = re.compile(r"\b(20\d{2})年(\d{1,2})月(\d{1,2})日\b")
 
 def normalize_date_text(text: str):
-    if not text:
+    # 两种日期格式都以 "20" 开头：绝大多数文本节点在这里直接跳过
+    if not text or "20" not in text:
         return None
     s = norm(text)
 
@@ -600,61 +683,66 @@ def fetch_rendered_html(url: str, retries: int = 2) -> str:
         browser.close()
         return last_html
 
-def parse_list_robust(html: str, page_url: str) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+def parse_list_robust(html: str, page_url: str, only_date: str = None) -> list[dict]:
+    soup = BeautifulSoup(html, "lxml")
     items = []
 
     for node in soup.find_all(string=True):
         dt = normalize_date_text(str(node))
         if not dt:
             continue
+        # 只要某一天时，其他日期的节点不必再向上找链接
+        if only_date and dt != only_date:
+            continue
 
         container = node.parent
         for _ in range(12):
             if not container:
                 break
             a = container.find("a", href=True)
-            if a and norm(a.get_text()):
+            # 标题文本只取一次，判空与写入复用
+            title = norm(a.get_text()) if a else ""
+            if title:
                 href = a["href"].strip()
                 if ".html" in href:
                     items.append({
                         "date": dt,
-                        "title": norm(a.get_text()),
+                        "title": title,
                         "url": urljoin(page_url, href)
                     })
                     break
             container = container.parent
 
-    seen, uniq = set(), []
-    for it in items:
-        key = (it["date"], it["title"], it["url"])
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(it)
+    # 键即条目全部字段，同键条目内容相同：dict 保序一次去重
+    uniq = list({(it["date"], it["title"], it["url"]): it for it in items}.values())
 
     uniq.sort(key=lambda x: (x["date"], x["title"]), reverse=True)
     return uniq
 
-def crawl_mohrss_target_day():
-    today = now_cn().date()
+def crawl_mohrss_target_day(now: datetime = None):
+    today = (now or now_cn()).date()
     target = target_prev_workday(today)
     list_url = (os.getenv("MOHRSS_LIST_URL") or MOHRSS_DEFAULT_LIST_URL).strip()
 
     html = fetch_rendered_html(list_url, retries=2)
-    items = parse_list_robust(html, list_url)
-    hit = [x for x in items if x["date"] == target.strftime("%Y-%m-%d")]
+    hit = parse_list_robust(html, list_url, only_date=target.strftime("%Y-%m-%d"))
     return target, list_url, hit
 
 
 # ===================== Markdown 组装（最终样式） =====================
-def build_enterprise_block(run_hrloo: bool, run_sina: bool) -> str:
+def build_enterprise_block(run_hrloo: bool, run_sina: bool, now: datetime = None) -> str:
+    now = now or now_cn()
     lines = ["## 🏢 财经新闻"]
     idx = 1
 
+    # 两个站点互不依赖：并发抓取，按固定顺序拼装
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hr_fut = pool.submit(crawl_hrloo, now) if run_hrloo else None
+        sina_fut = pool.submit(crawl_sina_target_day, now) if run_sina else None
+
     # 先三茅要点
-    if run_hrloo:
-        hr_item, hr_titles = crawl_hrloo()
+    if hr_fut:
+        hr_item, hr_titles = hr_fut.result()
         if hr_item and hr_titles:
             for t in hr_titles:
                 # 三茅要点详情统一跳到当天三茅日报文章页（同一个 url）
@@ -664,8 +752,8 @@ def build_enterprise_block(run_hrloo: bool, run_sina: bool) -> str:
             lines.append("（未发现当天的三茅日报）")
 
     # 再新浪财经
-    if run_sina:
-        _, sina_items = crawl_sina_target_day()
+    if sina_fut:
+        _, sina_items = sina_fut.result()
         if sina_items:
             for _, title, link in sina_items:
                 lines.append(md_item_with_detail(idx, title, link))
@@ -675,19 +763,20 @@ def build_enterprise_block(run_hrloo: bool, run_sina: bool) -> str:
 
     return "\n".join(lines).strip()
 
-def build_policy_block(run_mohrss: bool) -> str:
+def build_policy_block(run_mohrss: bool, now: datetime = None) -> str:
+    now = now or now_cn()
     lines = ["## 🧩 人社动态"]
     if not run_mohrss:
         lines.append("（本次未启用）")
         return "\n".join(lines).strip()
 
     # 周末不抓
-    wd = now_cn().weekday()
+    wd = now.weekday()
     if wd >= 5:
         lines.append("（周末不抓取）")
         return "\n".join(lines).strip()
 
-    _, _, hit = crawl_mohrss_target_day()
+    _, _, hit = crawl_mohrss_target_day(now)
     if not hit:
         lines.append("（无更新或本次未命中）")
         return "\n".join(lines).strip()
@@ -697,8 +786,8 @@ def build_policy_block(run_mohrss: bool) -> str:
 
     return "\n".join(lines).strip()
 
-def build_markdown(enterprise_block: str, policy_block: str) -> str:
-    mmdd = now_cn().strftime("%m-%d")
+def build_markdown(enterprise_block: str, policy_block: str, mmdd: str = None) -> str:
+    mmdd = mmdd or now_cn().strftime("%m-%d")
     md = [f"## 📌 {mmdd} 每日简报", ""]
     md.append(enterprise_block or "## 🏢 财经新闻\n（本次未生成）")
     md.append("\n---\n")
@@ -707,8 +796,12 @@ def build_markdown(enterprise_block: str, policy_block: str) -> str:
 
 
 def main():
+    # 整次运行共用同一时刻：周末判断、目标日、标题日期口径一致（跨零点也不会错位）
+    now = now_cn()
+    mmdd = now.strftime("%m-%d")
+
     # 周末不运行（你规则里周六/周日不抓）
-    wd = now_cn().weekday()
+    wd = now.weekday()
     if wd >= 5:
         print("[INFO] 周末不运行")
         return
@@ -717,16 +810,20 @@ def main():
     run_sina = (os.getenv("RUN_SINA", "1").strip() != "0")
     run_mohrss = (os.getenv("RUN_MOHRSS", "1").strip() != "0")
 
-    enterprise_block = build_enterprise_block(run_hrloo, run_sina)
-    policy_block = build_policy_block(run_mohrss)
+    # 财经新闻（requests）与人社动态（Playwright）都是纯 I/O 等待，并行执行
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ent_fut = pool.submit(build_enterprise_block, run_hrloo, run_sina, now)
+        pol_fut = pool.submit(build_policy_block, run_mohrss, now)
+    enterprise_block = ent_fut.result()
+    policy_block = pol_fut.result()
 
-    md = build_markdown(enterprise_block, policy_block)
+    md = build_markdown(enterprise_block, policy_block, mmdd)
 
     out_file = os.getenv("OUT_FILE", "daily_all.md")
     with open(out_file, "w", encoding="utf-8") as f:
         f.write(md)
 
-    title = f"{now_cn().strftime('%m-%d')} 每日简报"
+    title = f"{mmdd} 每日简报"
     results = dingtalk_send_markdown(title, md)
 
     for it in results:
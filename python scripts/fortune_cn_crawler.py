@@ -17,16 +17,27 @@
 
 import os
 import re
+import json
 import time
 import csv
 import hmac
 import base64
-import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin, quote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 优先用 C 实现的 lxml 解析器；环境里没装时退回内置 html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 # ============= 抓取基础配置 =============
 
@@ -34,10 +45,16 @@ BASE = "https://www.fortunechina.com"
 LIST_URL_BASE = "https://www.fortunechina.com/shangye/"
 MAX_PAGES = 1
 MAX_RETRY = 3
+ARTICLE_WORKERS = int(os.getenv("ARTICLE_WORKERS", "4"))  # 正文 + AI 摘要并发数
+AI_CONCURRENCY = int(os.getenv("AI_CONCURRENCY", "2"))    # 同时在途的 AI 请求上限（POST 不自动重试，避免 429）
+ARTICLE_INTERVAL = 0.5  # 相邻两次正文请求的最小间隔（秒），多线程下依然生效
 
 OUTPUT_CSV = "fortunechina_articles_with_ai_title.csv"
 OUTPUT_MD = "fortunechina_articles_with_ai_title.md"
 
+# 北京时间（固定 UTC+8，模块级只建一次）
+TZ_CN = timezone(timedelta(hours=8))
+
 
 def get_target_date() -> str:
     """
@@ -49,8 +66,7 @@ def get_target_date() -> str:
     if env_date:
         return env_date
 
-    tz_cn = timezone(timedelta(hours=8))
-    yesterday_cn = (datetime.now(tz_cn) - timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday_cn = (datetime.now(TZ_CN) - timedelta(days=1)).strftime("%Y-%m-%d")
     return yesterday_cn
 
 
@@ -63,10 +79,40 @@ DEFAULT_HEADERS = {
         "Chrome/126.0.0.0 Safari/537.36"
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Encoding": "gzip, deflate",  # 未依赖 brotli，不声明 br，免得收到无法解码的响应
     "Accept-Language": "zh-CN,zh;q=0.9",
     "Cache-Control": "no-cache",
 }
+# 只解析需要的容器，导航 / 页脚 / 脚本等不进树
+# class 按单词匹配：多 class 容器（如 "news-list clearfix"）也要保留
+LIST_STRAINER = SoupStrainer("ul", class_=re.compile(r"(?:^|\s)news-list(?:\s|$)"))
+ARTICLE_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)article-(?:mod|content)(?:\s|$)"))
+
+# 文章详情链接特征：content_数字.htm
+CONTENT_HREF_RE = re.compile(r"content_\d+\.htm")
+
+# 浏览器请求头只用于 fortunechina 页面；正文请求额外带上列表页 Referer（预先合并好，免得逐次 copy）
+ARTICLE_HEADERS = {**DEFAULT_HEADERS, "Referer": LIST_URL_BASE}
+
+
+def make_session() -> requests.Session:
+    """
+    共享会话：keep-alive 复用连接；连接错误 / 5xx 由 urllib3 的 Retry 按退避自动重试，
+    总尝试次数与 MAX_RETRY 一致。
+    """
+    s = requests.Session()
+    retry = Retry(
+        total=MAX_RETRY - 1,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+SESSION = make_session()
 
 # ============= SiliconFlow AI 配置 =============
 
@@ -83,6 +129,35 @@ AI_CHAT_URL = f"{AI_API_BASE}/chat/completions"
 AI_MODEL = os.getenv("AI_MODEL", "Qwen/Qwen2.5-7B-Instruct")
 
 
+# ============= 并发辅助：限流与按篇输出日志 =============
+
+_AI_SLOTS = threading.BoundedSemaphore(max(1, AI_CONCURRENCY))
+_THROTTLE_LOCK = threading.Lock()
+_next_article_at = 0.0
+_PRINT_LOCK = threading.Lock()
+_LOG = threading.local()
+
+
+def _throttle_article():
+    """全局按 ARTICLE_INTERVAL 排队发出正文请求，保持原先串行时的访问节奏"""
+    global _next_article_at
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        wait = _next_article_at - now
+        _next_article_at = max(now, _next_article_at) + ARTICLE_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def log(*args):
+    """处理单篇文章期间的输出先攒在本线程缓冲里，处理完一次性打印，避免多线程交错"""
+    lines = getattr(_LOG, "lines", None)
+    if lines is None:
+        print(*args)
+    else:
+        lines.append(" ".join(str(a) for a in args))
+
+
 def get_ai_summary(content: str, fallback_title: str = "") -> str:
     """
     使用 SiliconFlow 生成一句话摘要。
@@ -93,13 +168,13 @@ def get_ai_summary(content: str, fallback_title: str = "") -> str:
         return fallback_title or "内容过短，无需摘要"
 
     if not AI_API_KEY:
-        print("  ⚠️ 未配置 OPENAI_API_KEY，跳过 AI 摘要。")
+        log("  ⚠️ 未配置 OPENAI_API_KEY，跳过 AI 摘要。")
         return fallback_title or "（未配置 AI 摘要）"
 
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {AI_API_KEY}",
-        "Content-Type": "application/json",
+        "Content-Type": "application/json; charset=utf-8",
     }
 
     payload = {
@@ -121,27 +196,30 @@ def get_ai_summary(content: str, fallback_title: str = "") -> str:
         "temperature": 0.3,
     }
 
-    print(f"  🤖 正在调用 AI（{AI_CHAT_URL}，模型={AI_MODEL}）生成摘要...")
+    log(f"  🤖 正在调用 AI（{AI_CHAT_URL}，模型={AI_MODEL}）生成摘要...")
 
     try:
-        resp = requests.post(AI_CHAT_URL, headers=headers, json=payload, timeout=30)
+        # 中文正文直接以 UTF-8 发送，不转义成 \uXXXX，请求体约小一半
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        with _AI_SLOTS:
+            resp = SESSION.post(AI_CHAT_URL, headers=headers, data=body, timeout=30)
 
         if resp.status_code != 200:
-            print(f"  ❌ AI 状态码：{resp.status_code}")
+            log(f"  ❌ AI 状态码：{resp.status_code}")
             try:
-                print("  ❌ AI 返回内容：", resp.text)
+                log("  ❌ AI 返回内容：", resp.text[:500])
             except Exception:
                 pass
             resp.raise_for_status()
 
         data = resp.json()
         summary = data["choices"][0]["message"]["content"].strip()
-        summary = summary.splitlines()[0].strip()
-        print(f"  ✨ AI 摘要：{summary}")
+        summary = summary.partition("\n")[0].strip()
+        log(f"  ✨ AI 摘要：{summary}")
         return summary or (fallback_title or "（AI 摘要为空）")
 
     except Exception as e:
-        print(f"  ⚠️ AI 调用失败：{e}")
+        log(f"  ⚠️ AI 调用失败：{e}")
         return fallback_title or f"[AI 调用失败: {e}]"
 
 
@@ -160,13 +238,13 @@ def fetch_list(page: int = 1):
     print(f"\n--- 正在请求列表页: 第 {page} 页 ({current_list_url}) ---")
 
     try:
-        r = requests.get(current_list_url, headers=DEFAULT_HEADERS, timeout=15)
+        r = SESSION.get(current_list_url, headers=DEFAULT_HEADERS, timeout=15)
         r.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"⚠️ 列表页请求失败: {e}")
         return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = BeautifulSoup(r.text, HTML_PARSER, parse_only=LIST_STRAINER)
     items = []
 
     for li in soup.select("ul.news-list li.news-item"):
@@ -185,7 +263,7 @@ def fetch_list(page: int = 1):
             continue
 
         # 只要包含 content_数字 的链接
-        if not re.search(r"content_\d+\.htm", href):
+        if not CONTENT_HREF_RE.search(href):
             continue
 
         url_full = urljoin(current_list_url, href)
@@ -212,42 +290,30 @@ def fetch_article_content(item: dict):
     请求文章正文内容
     """
     url = item["url"]
-    headers = DEFAULT_HEADERS.copy()
-    headers["Referer"] = LIST_URL_BASE
 
-    for attempt in range(MAX_RETRY):
-        try:
-            r = requests.get(url, headers=headers, timeout=15)
-            r.raise_for_status()
-
-            soup = BeautifulSoup(r.text, "html.parser")
-            container = soup.select_one("div.article-mod div.word-text-con")
-            if not container:
-                container = soup.select_one("div.article-content")
-
-            if not container:
-                item["content"] = "[正文容器未找到]"
-                print(f"  ⚠️ 警告：URL {url} 访问成功但未找到正文容器")
-                return
-
-            paras = [
-                p.get_text(strip=True)
-                for p in container.find_all("p")
-                if p.get_text(strip=True)
-            ]
-            item["content"] = "\n".join(paras)
-            time.sleep(0.5)
-            return
-
-        except requests.exceptions.RequestException as e:
-            if attempt < MAX_RETRY - 1:
-                print(
-                    f"  ❌ 请求失败 ({r.status_code if 'r' in locals() else 'Error'}), 重试中...: {url}"
-                )
-                time.sleep(1)
-            else:
-                print(f"  ⛔️ 最终失败: {url} | 错误: {e}")
-                item["content"] = f"[获取失败: {e}]"
+    # 重试与退避由 SESSION 的 Retry 策略负责
+    try:
+        _throttle_article()
+        r = SESSION.get(url, headers=ARTICLE_HEADERS, timeout=15)
+        r.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        log(f"  ⛔️ 最终失败: {url} | 错误: {e}")
+        item["content"] = f"[获取失败: {e}]"
+        return
+
+    soup = BeautifulSoup(r.text, HTML_PARSER, parse_only=ARTICLE_STRAINER)
+    container = soup.select_one("div.article-mod div.word-text-con")
+    if not container:
+        container = soup.select_one("div.article-content")
+
+    if not container:
+        item["content"] = "[正文容器未找到]"
+        log(f"  ⚠️ 警告：URL {url} 访问成功但未找到正文容器")
+        return
+
+    # 每个段落只取一次文本，过滤空段时复用
+    paras = [t for t in (p.get_text(strip=True) for p in container.find_all("p")) if t]
+    item["content"] = "\n".join(paras)
 
 
 # ============= 保存 CSV =============
@@ -260,10 +326,13 @@ def save_to_csv(data: list, filename: str):
 
     fieldnames = ["title", "ai_summary", "date", "url", "content"]
     try:
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        # content 列是全文，加大写缓冲，避免每行触发一次落盘
+        with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            # 按列顺序预先取成元组，走 csv.writer 的位置写入，省去 DictWriter 逐格查字典
+            rows = [tuple(item.get(k, "") for k in fieldnames) for item in data]
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
         print(f"\n🎉 成功保存到 CSV：{filename}，共 {len(data)} 条。")
     except Exception as e:
         print(f"\n❌ CSV 保存失败：{e}")
@@ -276,19 +345,15 @@ def build_markdown(items: list) -> str:
     """
     生成适合钉钉发送的 Markdown 文本。
     """
+    header = f"### 财富中文网·商业频道精选（{TARGET_DATE}）"
     if not items:
-        return f"### 财富中文网·商业频道精选（{TARGET_DATE}）\n\n今日未抓到符合条件的新闻。"
-
-    lines = [
-        f"### 财富中文网·商业频道精选（{TARGET_DATE}）",
-        "",
-    ]
-
-    for idx, item in enumerate(items, start=1):
-        title = item.get("ai_summary") or item.get("title") or "（无标题）"
-        url = item.get("url", "")
-        lines.append(f"{idx}. [{title}]({url})")
+        return f"{header}\n\n今日未抓到符合条件的新闻。"
 
+    lines = [header, ""]
+    lines.extend(
+        f"{idx}. [{item.get('ai_summary') or item.get('title') or '（无标题）'}]({item.get('url', '')})"
+        for idx, item in enumerate(items, start=1)
+    )
     return "\n".join(lines)
 
 
@@ -308,8 +373,9 @@ def sign_dingtalk(secret: str, timestamp_ms: int) -> str:
     """
     按钉钉官方文档生成签名。
     """
-    string_to_sign = f"{timestamp_ms}\n{secret}"
-    hmac_code = hmac.new(secret.encode("utf-8"), string_to_sign.encode("utf-8"), digestmod=hashlib.sha256).digest()
+    secret_bytes = secret.encode("utf-8")
+    string_to_sign = b"%d\n%s" % (timestamp_ms, secret_bytes)
+    hmac_code = hmac.digest(secret_bytes, string_to_sign, "sha256")
     return quote_plus(base64.b64encode(hmac_code))
 
 
@@ -334,25 +400,28 @@ def send_dingtalk_markdown(title: str, text: str):
         print("⚠️ DINGTALK_BASES 与 DINGTALK_SECRETS 数量不一致，跳过钉钉推送。")
         return
 
+    payload = {
+        "msgtype": "markdown",
+        "markdown": {
+            "title": title,
+            "text": text,
+        },
+        "at": {
+            "isAtAll": False,
+        },
+    }
+    # 各机器人收到的消息体相同：只序列化一次，UTF-8 直发
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    json_headers = {"Content-Type": "application/json; charset=utf-8"}
+
     for idx, (base_url, secret) in enumerate(zip(bases, secrets), start=1):
         try:
             ts = int(time.time() * 1000)
             sign = sign_dingtalk(secret, ts)
             full_url = f"{base_url}&timestamp={ts}&sign={sign}"
 
-            payload = {
-                "msgtype": "markdown",
-                "markdown": {
-                    "title": title,
-                    "text": text,
-                },
-                "at": {
-                    "isAtAll": False,
-                },
-            }
-
             print(f"\n📨 正在向第 {idx} 个钉钉机器人发送消息...")
-            resp = requests.post(full_url, json=payload, timeout=10)
+            resp = SESSION.post(full_url, data=body, headers=json_headers, timeout=10)
             print(f"  钉钉返回状态码：{resp.status_code}")
             try:
                 print("  钉钉返回：", resp.text)
@@ -383,17 +452,33 @@ def main():
         all_articles.extend(list_items)
         time.sleep(1)
 
+    # 翻页时同一篇可能出现在相邻两页：按 URL 去重（保留首次出现），避免重复抓正文、重复调 AI
+    unique = {}
+    for item in all_articles:
+        unique.setdefault(item["url"], item)
+    all_articles = list(unique.values())
+
     print(
         f"\n=== 📥 链接收集完成，共 {len(all_articles)} 篇。开始抓取正文 + 生成 AI 摘要... ==="
     )
 
-    # 2. 抓取正文 + AI 摘要
-    count = 0
-    for item in all_articles:
-        count += 1
-        print(f"\n🔥 ({count}/{len(all_articles)}) 处理: {item['title']}")
-        fetch_article_content(item)
-        item["ai_summary"] = get_ai_summary(item["content"], item["title"])
+    # 2. 抓取正文 + AI 摘要：每篇互不依赖，线程池并发（结果写回各自的 item，顺序不变）
+    total = len(all_articles)
+
+    def process(indexed):
+        count, item = indexed
+        _LOG.lines = [f"\n🔥 ({count}/{total}) 处理: {item['title']}"]
+        try:
+            fetch_article_content(item)
+            item["ai_summary"] = get_ai_summary(item["content"], item["title"])
+        finally:
+            lines, _LOG.lines = _LOG.lines, None
+            with _PRINT_LOCK:
+                print("\n".join(lines))
+
+    if all_articles:
+        with ThreadPoolExecutor(max_workers=max(1, min(ARTICLE_WORKERS, total))) as ex:
+            list(ex.map(process, enumerate(all_articles, 1)))
 
     # 3. 统计与保存 CSV
     success_count = sum(
@@ -1,9 +1,9 @@
 import os
 import time
 import hmac
-import hashlib
 import base64
-import requests
+from urllib.parse import quote_plus
+from core.http import get_session
 
 def send_markdown(title, text):
     webhook = os.getenv("DINGTALK_SHIYANQUNWEBHOOK")
@@ -17,13 +17,11 @@ def send_markdown(title, text):
     sign = ""
 
     if secret:
-        string_to_sign = f"{timestamp}\n{secret}"
-        hmac_code = hmac.new(
-            secret.encode("utf-8"),
-            string_to_sign.encode("utf-8"),
-            hashlib.sha256
-        ).digest()
-        sign = base64.b64encode(hmac_code).decode("utf-8")
+        secret_bytes = secret.encode("utf-8")
+        string_to_sign = b"%s\n%s" % (timestamp.encode("ascii"), secret_bytes)
+        hmac_code = hmac.digest(secret_bytes, string_to_sign, "sha256")
+        # base64 中的 + / = 必须 URL 编码，否则钉钉会间歇性验签失败
+        sign = quote_plus(base64.b64encode(hmac_code))
 
     url = f"{webhook}&timestamp={timestamp}&sign={sign}" if secret else webhook
 
@@ -35,4 +33,4 @@ def send_markdown(title, text):
         }
     }
 
-    requests.post(url, json=data)
+    get_session().post(url, json=data, timeout=20)
@@ -1,8 +1,11 @@
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def get_session():
+    """进程内共享一个 Session：爬虫与钉钉推送复用同一连接池"""
     session = requests.Session()
     retries = Retry(
         total=3,
@@ -1,13 +1,19 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-def in_last_days(date_str, days=7):
+def in_last_days(date_str, days=7, today=None):
     """
     date_str: YYYY-MM-DD
+    today: 批量判断时由调用方传入同一天，避免逐条取当前时间
     """
+    # 补零的 YYYY-MM-DD 走 C 实现的 fromisoformat；其余形状（含 fromisoformat 额外接受的
+    # "20240105"、"2024-W01-5" 等）一律交给 strptime，保持只认 YYYY-MM-DD 的约定
     try:
-        d = datetime.strptime(date_str, "%Y-%m-%d").date()
+        if isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+            d = date.fromisoformat(date_str)
+        else:
+            d = datetime.strptime(date_str, "%Y-%m-%d").date()
     except Exception:
         return False
 
-    today = datetime.today().date()
+    today = today or datetime.today().date()
     return today - timedelta(days=days) <= d <= today
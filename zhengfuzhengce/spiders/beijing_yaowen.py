@@ -1,33 +1,55 @@
-from bs4 import BeautifulSoup
+from datetime import datetime
+from lxml import etree, html as lxml_html
 from core.http import get_session
 from core.timeutils import in_last_days
 
 URL = "https://www.beijing.gov.cn/ynwdt/yaowen/index.html"
 
+# 预编译 XPath：等价于 CSS "div.listBox ul.list li"，以及每条里的第一个 a / span
+_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+_LIST_ITEMS = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' listBox ')]"
+    "//ul[contains(concat(' ', normalize-space(@class), ' '), ' list ')]//li"
+)
+_FIRST_A = etree.XPath("(.//a)[1]")
+_FIRST_SPAN = etree.XPath("(.//span)[1]")
+
+def _text(node):
+    return "".join(t.strip() for t in node.itertext())
+
 def crawl():
     session = get_session()
     resp = session.get(URL, timeout=15)
-    resp.encoding = "utf-8"
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # 空响应 lxml 会抛 "Document is empty"；与原先一样按无条目处理
+    if not resp.content.strip():
+        return []
+    try:
+        tree = lxml_html.fromstring(resp.content, parser=_PARSER)
+    except etree.ParserError:
+        return []
 
     results = []
+    today = datetime.today().date()
 
-    for li in soup.select("div.listBox ul.list li"):
-        a = li.find("a")
-        span = li.find("span")
+    for li in _LIST_ITEMS(tree):
+        a = _FIRST_A(li)
+        span = _FIRST_SPAN(li)
 
         if not a or not span:
             continue
+        a, span = a[0], span[0]
 
-        title = a.get_text(strip=True)
-        url = a["href"]
+        title = _text(a)
+        url = a.get("href")
+        if not url:
+            continue
         if not url.startswith("http"):
             url = "https://www.beijing.gov.cn" + url
 
-        date = span.get_text(strip=True)
+        date = _text(span)
 
-        if in_last_days(date, 7):
+        if in_last_days(date, 7, today):
             results.append({
                 "title": title,
                 "url": url,